@@ -1,5 +1,7 @@
 # flake8: noqa
 
+import importlib.util
+
 from .api import Api
 from .authentication import (
     AuthenticationBase,
@@ -37,10 +39,82 @@ from .related import Related, RelatedId
 from .sorting import FieldSortingBase, FixedSorting, Sorting, SortingBase
 from .view import ApiView, GenericModelView, ModelView
 
-try:
-    from .jwt import JwkSetAuthentication, JwkSetPyJwt, JwtAuthentication
-except ImportError:
-    pass
+__version__ = "5.0.0"
+
+# -----------------------------------------------------------------------------
 
+# The JWT components need the optional PyJWT and cryptography dependencies,
+# which are slow to import, so only load them when they are first used.
+_JWT_NAMES = ("JwkSetAuthentication", "JwkSetPyJwt", "JwtAuthentication")
 
-__version__ = "5.0.0"
+# Check this without importing the dependencies.
+_JWT_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("jwt", "cryptography")
+)
+
+__all__ = [
+    "Api",
+    "ApiError",
+    "ApiView",
+    "ArgFilterBase",
+    "AuthenticationBase",
+    "AuthorizationBase",
+    "AuthorizeModifyMixin",
+    "ColumnFilter",
+    "CursorPaginationBase",
+    "DelimitedList",
+    "FieldFilterBase",
+    "FieldSortingBase",
+    "Filtering",
+    "FixedSorting",
+    "GenericModelView",
+    "HasAnyCredentialsAuthorization",
+    "HasCredentialsAuthorizationBase",
+    "HeaderAuthentication",
+    "HeaderAuthenticationBase",
+    "LimitOffsetPagination",
+    "LimitPagination",
+    "MaxLimitPagination",
+    "ModelFilter",
+    "ModelView",
+    "NoOpAuthentication",
+    "NoOpAuthorization",
+    "PagePagination",
+    "Related",
+    "RelatedId",
+    "RelatedItem",
+    "RelayCursorPagination",
+    "Sorting",
+    "SortingBase",
+    "get_item_or_404",
+    "model_filter",
+]
+
+if _JWT_AVAILABLE:
+    __all__ += _JWT_NAMES
+
+
+def __getattr__(name):
+    if name in _JWT_NAMES:
+        try:
+            from . import jwt
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from e
+
+        # Later lookups then don't need to go through here.
+        globals().update(
+            {jwt_name: getattr(jwt, jwt_name) for jwt_name in _JWT_NAMES}
+        )
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    if _JWT_AVAILABLE:
+        return sorted({*globals(), *_JWT_NAMES})
+
+    return sorted(globals())
@@ -1,11 +1,23 @@
 import base64
+import copy
+import functools
+import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
 
 import flask
 import jwt as jwt_lib
 from cryptography.hazmat.backends import default_backend
 from cryptography.x509 import load_der_x509_certificate
-from jwt import InvalidAlgorithmError, InvalidTokenError, PyJWS, PyJWT
+from jwt import (
+    DecodeError,
+    InvalidAlgorithmError,
+    InvalidTokenError,
+    PyJWS,
+    PyJWT,
+)
 
 from .authentication import HeaderAuthentication
 from .exceptions import ApiError
@@ -26,23 +38,130 @@ JWT_DECODE_ARG_KEYS = (
 
 
 class JwtAuthentication(HeaderAuthentication):
+    """Header authentication using JSON Web Tokens.
+
+    Decode arguments for :py:func:`jwt.decode` are read from the
+    ``RESTY_JWT_DECODE_*`` config keys, and can be overridden with keyword
+    arguments.
+
+    :param int cache_size: If set, keep the payloads of up to this many
+        successfully decoded tokens, so repeated requests with the same token
+        skip signature verification. A cached result is only used while the
+        decode arguments, and the JWK set if any, match the ones the token
+        was decoded with, so changing the app or its configuration never
+        widens which tokens are accepted. Up to this many tokens that are
+        malformed or have an invalid signature are also cached separately,
+        and are rejected without decoding them again.
+    :param float cache_ttl: The number of seconds to use a cached result for.
+        A cached payload is never used past the token's ``exp`` time. This
+        bounds how long e.g. a revoked token keeps working.
+    """
+
     CONFIG_KEY_TEMPLATE = "RESTY_JWT_DECODE_{}"
 
-    def __init__(self, **kwargs):
+    def __init__(self, *, cache_size=0, cache_ttl=5, **kwargs):
         super().__init__()
 
         self._decode_args = {
             key: kwargs[key] for key in JWT_DECODE_ARG_KEYS if key in kwargs
         }
 
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache = OrderedDict()
+        # Rejected tokens get their own LRU, so a flood of bad tokens can't
+        # evict the valid ones.
+        self._error_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def get_credentials_from_token(self, token):
         try:
-            payload = self.decode_token(token)
+            payload = self._decode_token_cached(token)
         except InvalidTokenError as e:
             raise ApiError(401, {"code": "invalid_token"}) from e
 
         return payload
 
+    def _decode_token_cached(self, token):
+        if not self._cache_size:
+            return self.decode_token(token)
+
+        # Don't keep the raw tokens around in memory.
+        cache_key = hashlib.sha256(token.encode()).digest()
+        cache_config = self._get_cache_config()
+
+        error = self._get_cache_entry(
+            self._error_cache, cache_key, cache_config
+        )
+        if error is not None:
+            error_class, error_args = error
+            raise error_class(*error_args)
+
+        payload = self._get_cache_entry(self._cache, cache_key, cache_config)
+        if payload is not None:
+            # Don't let callers modify the cached payload.
+            return copy.deepcopy(payload)
+
+        expires_at = time.time() + self._cache_ttl
+
+        try:
+            payload = self.decode_token(token)
+        except DecodeError as e:
+            # Malformed tokens and bad signatures don't depend on the current
+            # time, unlike e.g. expired tokens. Keep the error class and
+            # arguments rather than the exception itself, to avoid holding on
+            # to its traceback.
+            self._set_cache_entry(
+                self._error_cache,
+                cache_key,
+                (type(e), e.args),
+                expires_at,
+                cache_config,
+            )
+            raise
+
+        token_expires_at = payload.get("exp")
+        if token_expires_at is not None:
+            if not isinstance(token_expires_at, (int, float)):
+                # Let decode_token deal with malformed expiration times.
+                return payload
+
+            expires_at = min(expires_at, token_expires_at)
+
+        self._set_cache_entry(
+            self._cache,
+            cache_key,
+            copy.deepcopy(payload),
+            expires_at,
+            cache_config,
+        )
+        return payload
+
+    def _get_cache_config(self):
+        return self.get_jwt_decode_args()
+
+    def _get_cache_entry(self, cache, cache_key, cache_config):
+        with self._cache_lock:
+            entry = cache.get(cache_key)
+            if entry is None:
+                return None
+
+            value, expires_at, entry_cache_config = entry
+            if time.time() >= expires_at or entry_cache_config != cache_config:
+                del cache[cache_key]
+                return None
+
+            cache.move_to_end(cache_key)
+            return value
+
+    def _set_cache_entry(
+        self, cache, cache_key, value, expires_at, cache_config
+    ):
+        with self._cache_lock:
+            cache[cache_key] = (value, expires_at, cache_config)
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
     def decode_token(self, token):
         return self._pyjwt.decode(token, **self.get_jwt_decode_args())
 
@@ -78,7 +197,7 @@ class JwkSetPyJwt(PyJWT):
 
         # It's safe to use alg from the header here, as we verify that against
         # the algorithm whitelist.
-        alg = jwk["alg"] if "alg" in jwk else unverified_header["alg"]
+        alg = jwk["alg"] if "alg" in jwk else unverified_header.get("alg")
 
         # jwt.decode will also check this, but this is more defensive.
         if alg not in kwargs["algorithms"]:
@@ -106,14 +225,31 @@ class JwkSetPyJwt(PyJWT):
 
     def get_key_from_jwk(self, jwk, alg):
         if "x5c" in jwk:
-            return load_der_x509_certificate(
-                base64.b64decode(jwk["x5c"][0]), default_backend()
-            ).public_key()
-
-        algorithm = PyJWS()._algorithms[alg]
+            return _load_certificate_key(jwk["x5c"][0])
 
         # Awkward:
-        return algorithm.from_jwk(json.dumps(jwk))
+        return _load_jwk_key(alg, json.dumps(jwk))
+
+
+# -----------------------------------------------------------------------------
+
+# Loading keys is relatively expensive, and the same few keys are used for
+# every request, so keep the most recently used ones around.
+
+
+@functools.lru_cache(maxsize=32)
+def _load_certificate_key(certificate):
+    return load_der_x509_certificate(
+        base64.b64decode(certificate), default_backend()
+    ).public_key()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_jwk_key(alg, jwk_json):
+    return PyJWS()._algorithms[alg].from_jwk(jwk_json)
+
+
+# -----------------------------------------------------------------------------
 
 
 class JwkSetAuthentication(JwtAuthentication):
@@ -126,6 +262,9 @@ class JwkSetAuthentication(JwtAuthentication):
     def _pyjwt(self):
         return JwkSetPyJwt(self.jwk_set)
 
+    def _get_cache_config(self):
+        return {**super()._get_cache_config(), "jwk_set": self.jwk_set}
+
     @property
     def jwk_set(self):
         return (
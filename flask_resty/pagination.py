@@ -279,6 +279,11 @@ class CursorPaginationBase(LimitPagination):
     :param bool validate: If unset, bypass validation on cursor values. This is
         useful if the deserializer field imposes validation that will fail for
         on cursor values for items actually present.
+    :param bool row_values: If set, filter on cursors with a single row value
+        comparison like ``(size, id) > (?, ?)`` when every sorted column is
+        non-nullable and sorted in the same direction, which lets the database
+        use a composite index on those columns. Only use this if the database
+        supports row value comparisons.
     """
 
     #: The name of the query parameter to inspect for the cursor value.
@@ -293,9 +298,12 @@ class CursorPaginationBase(LimitPagination):
     before_arg = "before"
     last_arg = "last"
 
-    def __init__(self, *args, validate_values=True, **kwargs):
+    def __init__(
+        self, *args, validate_values=True, row_values=False, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         self._validate_values = validate_values
+        self._row_values = row_values
 
     def try_get_arg(self, arg):
         value = flask.request.args.get(arg)
@@ -529,11 +537,41 @@ class CursorPaginationBase(LimitPagination):
             for (field_name, asc), value in zip(field_orderings, cursor)
         )
 
+        if self._row_values and self._can_use_row_value(column_cursors):
+            return self.get_row_value_filter_clause(column_cursors)
+
         return sa.or_(
             self.get_filter_clause(column_cursors[: i + 1])
             for i in range(len(column_cursors))
         )
 
+    @staticmethod
+    def _can_use_row_value(column_cursors):
+        if len(column_cursors) < 2:
+            return False
+
+        if len({asc for _, asc, _ in column_cursors}) != 1:
+            return False
+
+        return all(
+            # Row value comparisons don't order NULLs the way we do, and
+            # booleans need the cast in _prepare_current_clause.
+            value is not None
+            and not isinstance(value, bool)
+            and not getattr(column.expression, "nullable", True)
+            for column, _, value in column_cursors
+        )
+
+    def get_row_value_filter_clause(self, column_cursors):
+        columns, ascs, values = zip(*column_cursors)
+        column_row = sa.tuple_(*columns)
+
+        # Comparing against a plain tuple binds each value with the type of
+        # the corresponding column.
+        if ascs[0]:
+            return column_row > values
+        return column_row < values
+
     @staticmethod
     def get_previous_clause(column_cursors):
         if not column_cursors:
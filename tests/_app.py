@@ -0,0 +1,85 @@
+import os
+
+import flask_sqlalchemy as fsa
+import pytest
+from flask import Flask
+
+from flask_resty.testing import ApiClient
+
+# -----------------------------------------------------------------------------
+
+
+def create_app():
+    app = Flask(__name__)
+    app.testing = True
+    return app
+
+
+def create_db(app):
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
+        "DATABASE_URL", "sqlite://"
+    )
+
+    # TODO: Remove once this is the default.
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    return fsa.SQLAlchemy(app)
+
+
+def create_client(app):
+    app.test_client_class = ApiClient
+    return app.test_client()
+
+
+def clear_db(app, db):
+    """Delete all rows from the tables of `db`.
+
+    This lets modules that share their app and tables across tests start
+    each test from empty tables without recreating the schema. Identity
+    columns are reset as well, so each test sees the same generated IDs.
+    """
+    tables = db.metadata.sorted_tables
+    if not tables:
+        return
+
+    with app.app_context(), db.engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            table_names = ", ".join(
+                connection.dialect.identifier_preparer.format_table(table)
+                for table in tables
+            )
+            connection.exec_driver_sql(
+                f"TRUNCATE {table_names} RESTART IDENTITY"
+            )
+        else:
+            # SQLite reuses rowids once the rows are gone.
+            for table in reversed(tables):
+                connection.execute(table.delete())
+
+
+def app_fixtures(scope):
+    """Create `app`, `db`, `client`, and `clean_db` fixtures.
+
+    The app, database, and client are shared across `scope`, so modules and
+    classes can set up their tables and routes once. Fixtures that add rows
+    should depend on `clean_db`, which clears the tables after each test.
+    """
+
+    @pytest.fixture(scope=scope)
+    def app():
+        return create_app()
+
+    @pytest.fixture(scope=scope)
+    def db(app):
+        return create_db(app)
+
+    @pytest.fixture(scope=scope)
+    def client(app):
+        return create_client(app)
+
+    @pytest.fixture
+    def clean_db(app, db):
+        yield
+        clear_db(app, db)
+
+    return app, db, client, clean_db
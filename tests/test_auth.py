@@ -1,5 +1,3 @@
-from unittest.mock import ANY, Mock, call
-
 import flask
 import pytest
 from marshmallow import Schema, fields
@@ -57,6 +55,9 @@ def auth():
     class UserAuthorization(
         AuthorizeModifyMixin, HasCredentialsAuthorizationBase
     ):
+        def __init__(self):
+            self.modify_actions = []
+
         def filter_query(self, query, view):
             return query.filter(
                 (view.model.owner_id == self.get_request_credentials())
@@ -70,13 +71,12 @@ def auth():
                 raise ApiError(403, {"code": "invalid_name"})
 
         def authorize_modify_item(self, item, action):
+            self.modify_actions.append(action)
+
             if item.owner_id != self.get_request_credentials():
                 raise ApiError(403, {"code": "invalid_user"})
 
     authorization = UserAuthorization()
-    authorization.authorize_modify_item = Mock(
-        wraps=authorization.authorize_modify_item, autospec=True
-    )
 
     class BearerWithFallbackAuthentication(HeaderAuthentication):
         credentials_arg = "secret"
@@ -217,10 +217,7 @@ def test_create(client, auth):
     )
     assert_response(response, 201)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create"),
-        call(ANY, "save"),
-    ]
+    assert auth["authorization"].modify_actions == ["create", "save"]
 
 
 def test_update(client, auth):
@@ -230,19 +227,14 @@ def test_update(client, auth):
     )
     assert_response(response, 200)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "update"),
-        call(ANY, "save"),
-    ]
+    assert auth["authorization"].modify_actions == ["update", "save"]
 
 
 def test_delete(client, auth):
     response = client.delete("/widgets/1?user_id=foo")
     assert_response(response, 204)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "delete")
-    ]
+    assert auth["authorization"].modify_actions == ["delete"]
 
 
 def test_retrieve_any_credentials(client):
@@ -270,9 +262,7 @@ def test_retrieve_create_transient_stub(client, auth):
         response, 200, {"id": "4", "owner_id": "foo", "name": None}
     )
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create")
-    ]
+    assert auth["authorization"].modify_actions == ["create"]
 
 
 def test_upsert_create(client, auth):
@@ -282,10 +272,7 @@ def test_upsert_create(client, auth):
     )
     assert_response(response, 201)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create"),
-        call(ANY, "save"),
-    ]
+    assert auth["authorization"].modify_actions == ["create", "save"]
 
 
 def test_upsert_update(client, auth):
@@ -295,10 +282,7 @@ def test_upsert_update(client, auth):
     )
     assert_response(response, 200)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "update"),
-        call(ANY, "save"),
-    ]
+    assert auth["authorization"].modify_actions == ["update", "save"]
 
 
 # -----------------------------------------------------------------------------
@@ -320,9 +304,7 @@ def test_error_create_unauthorized(client, auth):
     )
     assert_response(response, 403, [{"code": "invalid_name"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create")
-    ]
+    assert auth["authorization"].modify_actions == ["create"]
 
 
 def test_error_create_save_unauthorized(client, auth):
@@ -331,9 +313,7 @@ def test_error_create_save_unauthorized(client, auth):
     )
     assert_response(response, 403, [{"code": "invalid_user"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create")
-    ]
+    assert auth["authorization"].modify_actions == ["create"]
 
 
 def test_error_update_unauthorized(client, auth):
@@ -343,11 +323,8 @@ def test_error_update_unauthorized(client, auth):
     )
     assert_response(forbidden_save_response, 403, [{"code": "invalid_user"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "update"),
-        call(ANY, "save"),
-    ]
-    auth["authorization"].authorize_modify_item.reset_mock()
+    assert auth["authorization"].modify_actions == ["update", "save"]
+    auth["authorization"].modify_actions.clear()
 
     not_found_response = client.patch(
         "/widgets/1?user_id=bar",
@@ -355,8 +332,8 @@ def test_error_update_unauthorized(client, auth):
     )
     assert_response(not_found_response, 404)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == []
-    auth["authorization"].authorize_modify_item.reset_mock()
+    assert auth["authorization"].modify_actions == []
+    auth["authorization"].modify_actions.clear()
 
     forbidden_update_response = client.patch(
         "/widgets/3?user_id=foo",
@@ -364,24 +341,20 @@ def test_error_update_unauthorized(client, auth):
     )
     assert_response(forbidden_update_response, 403, [{"code": "invalid_user"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "update")
-    ]
+    assert auth["authorization"].modify_actions == ["update"]
 
 
 def test_error_delete_unauthorized(client, auth):
     not_found_response = client.delete("/widgets/1?user_id=bar")
     assert_response(not_found_response, 404)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == []
-    auth["authorization"].authorize_modify_item.reset_mock()
+    assert auth["authorization"].modify_actions == []
+    auth["authorization"].modify_actions.clear()
 
     forbidden_response = client.delete("/widgets/3?user_id=bar")
     assert_response(forbidden_response, 403, [{"code": "invalid_user"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "delete")
-    ]
+    assert auth["authorization"].modify_actions == ["delete"]
 
 
 def test_error_any_credentials_unauthenticated(client):
@@ -395,9 +368,7 @@ def test_error_retrieve_create_transient_stub_unauthorized(client, auth):
     )
     assert_response(response, 404)
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create")
-    ]
+    assert auth["authorization"].modify_actions == ["create"]
 
 
 def test_error_upsert_create_unauthorized(client, auth):
@@ -407,9 +378,7 @@ def test_error_upsert_create_unauthorized(client, auth):
     )
     assert_response(response, 403, [{"code": "invalid_name"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "create")
-    ]
+    assert auth["authorization"].modify_actions == ["create"]
 
 
 def test_error_upsert_update_unauthorized(client, auth):
@@ -419,9 +388,7 @@ def test_error_upsert_update_unauthorized(client, auth):
     )
     assert_response(response, 403, [{"code": "invalid_user"}])
 
-    assert auth["authorization"].authorize_modify_item.mock_calls == [
-        call(ANY, "update")
-    ]
+    assert auth["authorization"].modify_actions == ["update"]
 
 
 def test_error_retrieve_bearer_unauthenticated(client):
@@ -1,14 +1,18 @@
 import pytest
 from marshmallow import Schema, fields
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, insert
 
 from flask_resty import Api, GenericModelView
 from flask_resty.testing import assert_response
 
+from ._app import app_fixtures
+
 # -----------------------------------------------------------------------------
 
+app, db, client, clean_db = app_fixtures("module")
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def models(app, db):
     class Widget(db.Model):
         __tablename__ = "widgets"
@@ -26,7 +30,7 @@ def models(app, db):
         db.drop_all()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def schemas():
     class WidgetSchema(Schema):
         id = fields.Integer(as_string=True)
@@ -36,7 +40,7 @@ def schemas():
     return {"widget": WidgetSchema()}
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def routes(app, models, schemas):
     class WidgetViewBase(GenericModelView):
         model = models["widget"]
@@ -69,14 +73,15 @@ def routes(app, models, schemas):
 
 
 @pytest.fixture(autouse=True)
-def data(app, db, models):
+def data(app, db, models, clean_db):
     with app.app_context():
-        db.session.add_all(
-            (
-                models["widget"](name="Foo", description="foo widget"),
-                models["widget"](name="Bar", description="bar widget"),
-                models["widget"](name="Baz", description="baz widget"),
-            )
+        db.session.execute(
+            insert(models["widget"]),
+            [
+                {"name": "Foo", "description": "foo widget"},
+                {"name": "Bar", "description": "bar widget"},
+                {"name": "Baz", "description": "baz widget"},
+            ],
         )
         db.session.commit()
 
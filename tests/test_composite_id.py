@@ -1,6 +1,6 @@
 import pytest
 from marshmallow import Schema, fields
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, insert
 
 from flask_resty import Api, GenericModelView
 from flask_resty.testing import assert_response
@@ -69,12 +69,13 @@ def routes(app, models, schemas):
 @pytest.fixture(autouse=True)
 def data(app, db, models):
     with app.app_context():
-        db.session.add_all(
-            (
-                models["widget"](id_1=1, id_2=2, name="Foo"),
-                models["widget"](id_1=1, id_2=3, name="Bar"),
-                models["widget"](id_1=4, id_2=5, name="Baz"),
-            )
+        db.session.execute(
+            insert(models["widget"]),
+            [
+                {"id_1": 1, "id_2": 2, "name": "Foo"},
+                {"id_1": 1, "id_2": 3, "name": "Bar"},
+                {"id_1": 4, "id_2": 5, "name": "Baz"},
+            ],
         )
         db.session.commit()
 
@@ -6,49 +6,52 @@ from flask_resty.fields import DelimitedList, RelatedItem
 # -----------------------------------------------------------------------------
 
 
-@pytest.fixture
-def related_schema_class():
-    class RelatedSchema(Schema):
-        id = fields.Integer(as_string=True)
-        name = fields.String(required=True)
+class RelatedSchema(Schema):
+    id = fields.Integer(as_string=True)
+    name = fields.String(required=True)
 
-    return RelatedSchema
 
+class SingleSchema(Schema):
+    child = RelatedItem(RelatedSchema, required=True)
 
-@pytest.fixture
-def single_schema(related_schema_class):
-    class SingleSchema(Schema):
-        child = RelatedItem(related_schema_class, required=True)
 
-    return SingleSchema()
+class ManySchema(Schema):
+    children = RelatedItem(RelatedSchema, many=True, required=True)
+
+
+class DelimitedListSchema(Schema):
+    ids = DelimitedList(fields.String, required=True)
+
+
+class DelimitedListAsStringSchema(Schema):
+    ids = DelimitedList(fields.String, as_string=True, required=True)
+
 
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def single_schema():
+    return SingleSchema()
 
-@pytest.fixture
-def many_schema(related_schema_class):
-    class ManySchema(Schema):
-        children = RelatedItem(related_schema_class, many=True, required=True)
 
+@pytest.fixture(scope="module")
+def many_schema():
     return ManySchema()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def error_messages():
     return RelatedItem(None).error_messages
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delimited_list_schema():
-    class DelimitedListSchema(Schema):
-        ids = DelimitedList(fields.String, required=True)
-
     return DelimitedListSchema()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def delimited_list_as_string_schema():
-    class DelimitedListAsStringSchema(Schema):
-        ids = DelimitedList(fields.String, as_string=True, required=True)
-
     return DelimitedListAsStringSchema()
 
 
@@ -2,7 +2,7 @@ import operator
 
 import pytest
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, insert
 
 from flask_resty import (
     Api,
@@ -14,12 +14,36 @@ from flask_resty import (
 )
 from flask_resty.testing import assert_response
 
+from ._app import app_fixtures
 from ._constants import LOAD_DEFAULT_KWARG
 
 # -----------------------------------------------------------------------------
 
+RED_1 = {"id": "1", "color": "red", "size": 1}
+GREEN_2 = {"id": "2", "color": "green", "size": 2}
+BLUE_3 = {"id": "3", "color": "blue", "size": 3}
+RED_4 = {"id": "4", "color": "red", "size": 6}
 
-@pytest.fixture
+# -----------------------------------------------------------------------------
+
+
+class WidgetSchema(Schema):
+    id = fields.Integer(as_string=True)
+    color = fields.String()
+    size = fields.Integer(validate=validate.Range(min=1))
+
+
+@model_filter(fields.String(required=True), separator=None)
+def filter_color_custom(model, value):
+    return model.color == value
+
+
+# -----------------------------------------------------------------------------
+
+app, db, client, clean_db = app_fixtures("module")
+
+
+@pytest.fixture(scope="module")
 def models(app, db):
     class Widget(db.Model):
         __tablename__ = "widgets"
@@ -37,30 +61,11 @@ def models(app, db):
         db.drop_all()
 
 
-@pytest.fixture
-def schemas():
-    class WidgetSchema(Schema):
-        id = fields.Integer(as_string=True)
-        color = fields.String()
-        size = fields.Integer(validate=validate.Range(min=1))
-
-    return {"widget": WidgetSchema()}
-
-
-@pytest.fixture
-def filter_fields():
-    @model_filter(fields.String(required=True), separator=None)
-    def filter_color_custom(model, value):
-        return model.color == value
-
-    return {"color_custom": filter_color_custom}
-
-
-@pytest.fixture(autouse=True)
-def routes(app, models, schemas, filter_fields):
+@pytest.fixture(scope="module", autouse=True)
+def routes(app, models):
     class WidgetViewBase(GenericModelView):
         model = models["widget"]
-        schema = schemas["widget"]
+        schema = WidgetSchema()
 
         filtering = Filtering(
             color=operator.eq,
@@ -97,7 +102,7 @@ def routes(app, models, schemas, filter_fields):
             return self.list()
 
     class WidgetColorCustomListView(WidgetViewBase):
-        filtering = Filtering(color=filter_fields["color_custom"])
+        filtering = Filtering(color=filter_color_custom)
 
         def get(self):
             return self.list()
@@ -122,15 +127,16 @@ def routes(app, models, schemas, filter_fields):
 
 
 @pytest.fixture(autouse=True)
-def data(app, db, models):
+def data(app, db, models, clean_db):
     with app.app_context():
-        db.session.add_all(
-            (
-                models["widget"](color="red", size=1),
-                models["widget"](color="green", size=2),
-                models["widget"](color="blue", size=3),
-                models["widget"](color="red", size=6),
-            )
+        db.session.execute(
+            insert(models["widget"]),
+            [
+                {"color": "red", "size": 1},
+                {"color": "green", "size": 2},
+                {"color": "blue", "size": 3},
+                {"color": "red", "size": 6},
+            ],
         )
         db.session.commit()
 
@@ -138,193 +144,132 @@ def data(app, db, models):
 # -----------------------------------------------------------------------------
 
 
-def test_eq(client):
-    response = client.get("/widgets?color=red")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "1", "color": "red", "size": 1},
-            {"id": "4", "color": "red", "size": 6},
-        ],
-    )
-
-
-def test_eq_many(client):
-    response = client.get("/widgets?color=green,blue")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "2", "color": "green", "size": 2},
-            {"id": "3", "color": "blue", "size": 3},
-        ],
-    )
-
-
-def test_eq_many_custom_separator(client):
-    response = client.get("/widgets?size=2|3")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "2", "color": "green", "size": 2},
-            {"id": "3", "color": "blue", "size": 3},
-        ],
-    )
-
-
-def test_eq_empty_custom_column_element(client):
-    response = client.get("/widgets?size=")
-    assert_response(response, 200, [])
-
-
-def test_eq_empty_allow_empty(client):
-    response = client.get("/widgets?color_allow_empty=")
-    assert_response(response, 200, [])
-
-
-def test_ge(client):
-    response = client.get("/widgets?size_min=3")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "3", "color": "blue", "size": 3},
-            {"id": "4", "color": "red", "size": 6},
-        ],
-    )
-
-
-def test_custom_operator(client):
-    response = client.get("/widgets?size_divides=2")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "2", "color": "green", "size": 2},
-            {"id": "4", "color": "red", "size": 6},
-        ],
-    )
-
-
-def test_column_filter_required_present(client):
-    response = client.get("/widgets_size_required?size=1")
-    assert_response(response, 200, [{"id": "1", "color": "red", "size": 1}])
-
-
-def test_combine(client):
-    response = client.get("/widgets_size_required?size=1&color=green")
-    assert_response(response, 200, [])
-
-
-def test_column_filter_unvalidated(client):
-    response = client.get("/widgets?size_min_unvalidated=-1")
-    assert_response(
-        response, 200, [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}]
-    )
-
-
-def test_column_filter_skip_invalid(client):
-    response = client.get("/widgets?size_skip_invalid=foo")
-    assert_response(response, 200, [])
-
-
-def test_model_filter(client):
-    response = client.get("/widgets?size_is_odd=true")
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "1", "color": "red", "size": 1},
-            {"id": "3", "color": "blue", "size": 3},
-        ],
-    )
-
-
-def test_model_filter_kwargs(client):
-    red_response = client.get("/widgets_color_custom?color=red")
-    assert_response(
-        red_response,
-        200,
-        [
-            {"id": "1", "color": "red", "size": 1},
-            {"id": "4", "color": "red", "size": 6},
-        ],
-    )
-
-    separator_response = client.get("/widgets_color_custom?color=red,blue")
-    assert_response(separator_response, 200, [])
-
-
-def test_model_filter_default(client):
-    response = client.get("/widgets_default_filters")
-    assert_response(response, 200, [{"id": "1", "color": "red", "size": 1}])
-
-
-def test_model_filter_default_override(client):
-    response = client.get("/widgets_default_filters?color=blue&size=3")
-    assert_response(response, 200, [{"id": "3", "color": "blue", "size": 3}])
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    (
+        pytest.param("/widgets?color=red", [RED_1, RED_4], id="eq"),
+        pytest.param(
+            "/widgets?color=green,blue", [GREEN_2, BLUE_3], id="eq_many"
+        ),
+        pytest.param(
+            "/widgets?size=2|3",
+            [GREEN_2, BLUE_3],
+            id="eq_many_custom_separator",
+        ),
+        pytest.param(
+            "/widgets?size=", [], id="eq_empty_custom_column_element"
+        ),
+        pytest.param(
+            "/widgets?color_allow_empty=", [], id="eq_empty_allow_empty"
+        ),
+        pytest.param("/widgets?size_min=3", [BLUE_3, RED_4], id="ge"),
+        pytest.param(
+            "/widgets?size_divides=2", [GREEN_2, RED_4], id="custom_operator"
+        ),
+        pytest.param(
+            "/widgets_size_required?size=1",
+            [RED_1],
+            id="column_filter_required_present",
+        ),
+        pytest.param(
+            "/widgets_size_required?size=1&color=green", [], id="combine"
+        ),
+        pytest.param(
+            "/widgets?size_min_unvalidated=-1",
+            [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}],
+            id="column_filter_unvalidated",
+        ),
+        pytest.param(
+            "/widgets?size_skip_invalid=foo",
+            [],
+            id="column_filter_skip_invalid",
+        ),
+        pytest.param(
+            "/widgets?size_is_odd=true", [RED_1, BLUE_3], id="model_filter"
+        ),
+        pytest.param(
+            "/widgets_color_custom?color=red",
+            [RED_1, RED_4],
+            id="model_filter_kwargs",
+        ),
+        pytest.param(
+            "/widgets_color_custom?color=red,blue",
+            [],
+            id="model_filter_kwargs_separator",
+        ),
+        pytest.param(
+            "/widgets_default_filters", [RED_1], id="model_filter_default"
+        ),
+        pytest.param(
+            "/widgets_default_filters?color=blue&size=3",
+            [BLUE_3],
+            id="model_filter_default_override",
+        ),
+    ),
+)
+def test_filter(client, url, expected):
+    response = client.get(url)
+    assert_response(response, 200, expected)
 
 
 # -----------------------------------------------------------------------------
 
 
-def test_error_invalid_type(client):
-    response = client.get("/widgets?size_min=foo")
-    assert_response(
-        response,
-        400,
-        [
-            {
-                "code": "invalid_filter",
-                "detail": "Not a valid integer.",
-                "source": {"parameter": "size_min"},
-            }
-        ],
-    )
-
-
-def test_error_unvalidated_invalid_type(client):
-    response = client.get("/widgets?size_min_unvalidated=foo")
-    assert_response(
-        response,
-        400,
-        [
-            {
-                "code": "invalid_filter",
-                "detail": "Not a valid integer.",
-                "source": {"parameter": "size_min_unvalidated"},
-            }
-        ],
-    )
-
-
-def test_error_invalid_value(client):
-    response = client.get("/widgets?size_min=-1")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_filter", "source": {"parameter": "size_min"}}],
-    )
-
-
-def test_error_column_filter_required_missing(client):
-    response = client.get("/widgets_size_required")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_filter.missing", "source": {"parameter": "size"}}],
-    )
-
-
-def test_error_model_filter_required_missing(client):
-    response = client.get("/widgets_color_custom")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_filter.missing", "source": {"parameter": "color"}}],
-    )
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    (
+        pytest.param(
+            "/widgets?size_min=foo",
+            [
+                {
+                    "code": "invalid_filter",
+                    "detail": "Not a valid integer.",
+                    "source": {"parameter": "size_min"},
+                }
+            ],
+            id="invalid_type",
+        ),
+        pytest.param(
+            "/widgets?size_min_unvalidated=foo",
+            [
+                {
+                    "code": "invalid_filter",
+                    "detail": "Not a valid integer.",
+                    "source": {"parameter": "size_min_unvalidated"},
+                }
+            ],
+            id="unvalidated_invalid_type",
+        ),
+        pytest.param(
+            "/widgets?size_min=-1",
+            [{"code": "invalid_filter", "source": {"parameter": "size_min"}}],
+            id="invalid_value",
+        ),
+        pytest.param(
+            "/widgets_size_required",
+            [
+                {
+                    "code": "invalid_filter.missing",
+                    "source": {"parameter": "size"},
+                }
+            ],
+            id="column_filter_required_missing",
+        ),
+        pytest.param(
+            "/widgets_color_custom",
+            [
+                {
+                    "code": "invalid_filter.missing",
+                    "source": {"parameter": "color"},
+                }
+            ],
+            id="model_filter_required_missing",
+        ),
+    ),
+)
+def test_error_filter(client, url, expected):
+    response = client.get(url)
+    assert_response(response, 400, expected)
 
 
 def test_error_missing_operator():
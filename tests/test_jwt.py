@@ -1,25 +1,54 @@
+import importlib
 import json
+import sys
+import time
 
 import pytest
 from marshmallow import Schema, fields
-from sqlalchemy import Column, Integer, String
-
-from flask_resty import Api, GenericModelView, HasAnyCredentialsAuthorization
+from sqlalchemy import Column, Integer, String, insert
+
+from flask_resty import (
+    Api,
+    ApiError,
+    GenericModelView,
+    HasAnyCredentialsAuthorization,
+)
 from flask_resty.testing import assert_response
 
+from ._app import app_fixtures, create_app
+
 # -----------------------------------------------------------------------------
 
-try:
-    from flask_resty import JwkSetAuthentication, JwtAuthentication
-except ImportError:
-    pytestmark = pytest.mark.skip(reason="JWT support not installed")
+pytest.importorskip("flask_resty.jwt", reason="JWT support not installed")
+
+import jwt
+
+from flask_resty import JwkSetAuthentication, JwtAuthentication
 
 # -----------------------------------------------------------------------------
 
 
+class WidgetSchema(Schema):
+    id = fields.Integer(as_string=True)
+    owner_id = fields.String()
+
+
+class UserAuthorization(HasAnyCredentialsAuthorization):
+    def filter_query(self, query, view):
+        return query.filter_by(owner_id=self.get_request_credentials()["sub"])
+
+
+# -----------------------------------------------------------------------------
+
+
+# Each test class registers its own routes, so it needs its own app.
+app, db, client, clean_db = app_fixtures("class")
+
+
 class AbstractTestJwt:
-    @pytest.fixture
-    def models(self, app, db):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def models(cls, app, db):
         class Widget(db.Model):
             __tablename__ = "widgets"
 
@@ -34,20 +63,19 @@ class AbstractTestJwt:
         with app.app_context():
             db.drop_all()
 
-    @pytest.fixture
-    def schemas(self):
-        class WidgetSchema(Schema):
-            id = fields.Integer(as_string=True)
-            owner_id = fields.String()
-
+    @pytest.fixture(scope="class")
+    @classmethod
+    def schemas(cls):
         return {"widget": WidgetSchema()}
 
-    @pytest.fixture
-    def auth(self, app):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def auth(cls, app):
         raise NotImplementedError()
 
-    @pytest.fixture(autouse=True)
-    def routes(self, app, models, schemas, auth):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def routes(cls, app, models, schemas, auth):
         class WidgetListView(GenericModelView):
             model = models["widget"]
             schema = schemas["widget"]
@@ -62,13 +90,11 @@ class AbstractTestJwt:
         api.add_resource("/widgets", WidgetListView)
 
     @pytest.fixture(autouse=True)
-    def data(self, app, db, models):
+    def data(self, app, db, models, clean_db):
         with app.app_context():
-            db.session.add_all(
-                (
-                    models["widget"](owner_id="foo"),
-                    models["widget"](owner_id="bar"),
-                )
+            db.session.execute(
+                insert(models["widget"]),
+                [{"owner_id": "foo"}, {"owner_id": "bar"}],
             )
             db.session.commit()
 
@@ -80,13 +106,14 @@ class AbstractTestJwt:
     def invalid_token(self, request):
         raise NotImplementedError()
 
-    @pytest.mark.parametrize("scheme", ("Bearer", "bearer"))
-    def test_header(self, client, scheme, token):
-        response = client.get(
-            "/widgets", headers={"Authorization": f"{scheme} {token}"}
-        )
+    def test_header(self, client, token):
+        # The scheme is case-insensitive.
+        for scheme in ("Bearer", "bearer"):
+            response = client.get(
+                "/widgets", headers={"Authorization": f"{scheme} {token}"}
+            )
 
-        assert_response(response, 200, [{"id": "1", "owner_id": "foo"}])
+            assert_response(response, 200, [{"id": "1", "owner_id": "foo"}])
 
     def test_error_unauthenticated(self, client):
         response = client.get("/widgets")
@@ -115,8 +142,9 @@ class AbstractTestJwt:
 
 
 class TestJwt(AbstractTestJwt):
-    @pytest.fixture
-    def auth(self, app):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def auth(cls, app):
         app.config.update(
             {
                 "RESTY_JWT_DECODE_KEY": "secret",
@@ -125,12 +153,6 @@ class TestJwt(AbstractTestJwt):
         )
         authentication = JwtAuthentication(issuer="resty")
 
-        class UserAuthorization(HasAnyCredentialsAuthorization):
-            def filter_query(self, query, view):
-                return query.filter_by(
-                    owner_id=self.get_request_credentials()["sub"]
-                )
-
         return {
             "authentication": authentication,
             "authorization": UserAuthorization(),
@@ -159,6 +181,7 @@ class TestJwt(AbstractTestJwt):
 
 class TestJwkSet(AbstractTestJwt):
     @pytest.fixture(
+        scope="module",
         params=(
             pytest.param(
                 "tests/fixtures/testkey_rsa_pub.json", id="public_key"
@@ -170,22 +193,17 @@ class TestJwkSet(AbstractTestJwt):
         with open(request.param) as rsa_pub_file:
             return json.load(rsa_pub_file)
 
-    @pytest.fixture()
-    def auth(self, app, jwk_set):
-        app.config.update(
-            {
-                "RESTY_JWT_DECODE_JWK_SET": jwk_set,
-                "RESTY_JWT_DECODE_ALGORITHMS": ["RS256"],
-            }
-        )
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def jwk_set_config(cls, app, jwk_set):
+        app.config["RESTY_JWT_DECODE_JWK_SET"] = jwk_set
 
-        authentication = JwkSetAuthentication(issuer="resty")
+    @pytest.fixture(scope="class")
+    @classmethod
+    def auth(cls, app):
+        app.config["RESTY_JWT_DECODE_ALGORITHMS"] = ["RS256"]
 
-        class UserAuthorization(HasAnyCredentialsAuthorization):
-            def filter_query(self, query, view):
-                return query.filter_by(
-                    owner_id=self.get_request_credentials()["sub"]
-                )
+        authentication = JwkSetAuthentication(issuer="resty")
 
         return {
             "authentication": authentication,
@@ -219,7 +237,239 @@ class TestJwkSet(AbstractTestJwt):
                 "eyJ0eXAiOiJKV1QiLCJraWQiOiJmb28uY29tIn0=.eyJpc3MiOiJyZXN0eSIsInN1YiI6ImZvbyJ9.0hkDQT1lnMoGjweZeJDeSfVMllhzlmYtSqErpeU5pp7TK5OkIoLeMCSHjqYdCOwwha8znK6hBxKO-LzT4PPuhe0LnNb_qZpEbtoX6ldN8LSkhCv3Jr8lwt_hs09-lHXxdrknuYmooICI6Q66QzOpTSF4j867UwUYtfVsMpfofxpiRCJOOvynpquYGbgXc59SGJjM5wPAgYo782uRErnRFX7YJmwt5wINjvsKhr0Ry512w_EC--jDGEpcWaNKMDXKL0UMQXWoOM5IlUMA7Kr2bF966X2xuUdRnJinVGnJvdK8yKyZg_qPA26OygLeJUqF-R4jVC-lYEfte7EOLpYBBQ",
                 id="alg_missing",
             ),
+            pytest.param(
+                "eyJ0eXAiOiAiSldUIiwgImtpZCI6ICJiYXIuY29tIn0.eyJpc3MiOiJyZXN0eSIsInN1YiI6ImZvbyJ9.c2ln",
+                id="alg_missing_jwk_alg_missing",
+            ),
         ),
     )
     def invalid_token(self, request):
         return request.param
+
+
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cached_authentication(app):
+    app.config.update(
+        {
+            "RESTY_JWT_DECODE_KEY": "secret",
+            "RESTY_JWT_DECODE_ALGORITHMS": ["HS256"],
+        }
+    )
+    return JwtAuthentication(issuer="resty", cache_size=1)
+
+
+@pytest.fixture
+def decoded_tokens(cached_authentication, monkeypatch):
+    decoded_tokens = []
+    decode_token = cached_authentication.decode_token
+
+    def record_decode_token(token):
+        decoded_tokens.append(token)
+        return decode_token(token)
+
+    monkeypatch.setattr(
+        cached_authentication, "decode_token", record_decode_token
+    )
+    return decoded_tokens
+
+
+def encode_token(**payload):
+    return jwt.encode({"iss": "resty", **payload}, "secret", "HS256")
+
+
+def test_cache(app, cached_authentication, decoded_tokens):
+    token = encode_token(sub="foo")
+
+    with app.app_context():
+        for _ in range(2):
+            assert cached_authentication.get_credentials_from_token(token) == {
+                "iss": "resty",
+                "sub": "foo",
+            }
+
+    assert decoded_tokens == [token]
+
+
+def test_cache_ttl(app, cached_authentication, decoded_tokens, monkeypatch):
+    now = time.time()
+    token = encode_token(sub="foo")
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+
+        monkeypatch.setattr(time, "time", lambda: now + 10)
+        cached_authentication.get_credentials_from_token(token)
+
+    assert decoded_tokens == [token, token]
+
+
+def test_cache_config(app, cached_authentication):
+    token = encode_token(sub="foo")
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+
+        app.config["RESTY_JWT_DECODE_KEY"] = "other"
+        with pytest.raises(ApiError):
+            cached_authentication.get_credentials_from_token(token)
+
+
+def test_cache_app(app, cached_authentication):
+    token = encode_token(sub="foo")
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+
+    other_app = create_app()
+    other_app.config.update(
+        {
+            "RESTY_JWT_DECODE_KEY": "other",
+            "RESTY_JWT_DECODE_ALGORITHMS": ["HS256"],
+        }
+    )
+
+    with other_app.app_context():
+        with pytest.raises(ApiError):
+            cached_authentication.get_credentials_from_token(token)
+
+
+def test_cache_copy(app, cached_authentication):
+    token = encode_token(sub="foo", roles=["admin"])
+
+    with app.app_context():
+        for _ in range(2):
+            payload = cached_authentication.get_credentials_from_token(token)
+            payload["sub"] = "bar"
+            payload["roles"].append("owner")
+
+        assert cached_authentication.get_credentials_from_token(token) == {
+            "iss": "resty",
+            "sub": "foo",
+            "roles": ["admin"],
+        }
+
+
+def test_cache_evict(app, cached_authentication, decoded_tokens):
+    token = encode_token(sub="foo")
+    other_token = encode_token(sub="bar")
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+        cached_authentication.get_credentials_from_token(other_token)
+        cached_authentication.get_credentials_from_token(token)
+
+    assert decoded_tokens == [token, other_token, token]
+
+
+def test_cache_expired(
+    app, cached_authentication, decoded_tokens, monkeypatch
+):
+    now = time.time()
+    token = encode_token(sub="foo", exp=now + 2)
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+
+        # This is still within the TTL, but past the token's expiration time.
+        monkeypatch.setattr(time, "time", lambda: now + 3)
+        cached_authentication.get_credentials_from_token(token)
+
+    assert decoded_tokens == [token, token]
+
+
+def test_cache_invalid(
+    app, cached_authentication, decoded_tokens, monkeypatch
+):
+    now = time.time()
+    token = jwt.encode({"iss": "resty", "sub": "foo"}, "other", "HS256")
+
+    with app.app_context():
+        for _ in range(2):
+            with pytest.raises(ApiError) as excinfo:
+                cached_authentication.get_credentials_from_token(token)
+
+            assert isinstance(
+                excinfo.value.__cause__, jwt.InvalidSignatureError
+            )
+
+        # Within the TTL, the bad signature is cached.
+        assert decoded_tokens == [token]
+
+        monkeypatch.setattr(time, "time", lambda: now + 10)
+        with pytest.raises(ApiError):
+            cached_authentication.get_credentials_from_token(token)
+
+        assert decoded_tokens == [token, token]
+
+
+def test_cache_invalid_config(app, cached_authentication):
+    token = jwt.encode({"iss": "resty", "sub": "foo"}, "other", "HS256")
+
+    with app.app_context():
+        with pytest.raises(ApiError):
+            cached_authentication.get_credentials_from_token(token)
+
+        app.config["RESTY_JWT_DECODE_KEY"] = "other"
+        assert cached_authentication.get_credentials_from_token(token) == {
+            "iss": "resty",
+            "sub": "foo",
+        }
+
+
+def test_cache_invalid_separate(app, cached_authentication, decoded_tokens):
+    token = encode_token(sub="foo")
+
+    with app.app_context():
+        cached_authentication.get_credentials_from_token(token)
+
+        # Rejected tokens don't evict valid ones.
+        with pytest.raises(ApiError):
+            cached_authentication.get_credentials_from_token("foo")
+
+        cached_authentication.get_credentials_from_token(token)
+
+    assert decoded_tokens == [token, "foo"]
+
+
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def import_flask_resty(monkeypatch):
+    # Import a fresh copy of the package, as other tests use the JWT module.
+    monkeypatch.delitem(sys.modules, "flask_resty")
+    monkeypatch.delitem(sys.modules, "flask_resty.jwt", raising=False)
+
+    return lambda: importlib.import_module("flask_resty")
+
+
+def test_lazy_import(import_flask_resty):
+    flask_resty = import_flask_resty()
+    assert "flask_resty.jwt" not in sys.modules
+
+    assert {"JwtAuthentication", "JwkSetAuthentication", "JwkSetPyJwt"} <= {
+        *dir(flask_resty),
+        *flask_resty.__all__,
+    }
+
+    assert (
+        flask_resty.JwtAuthentication is vars(flask_resty)["JwtAuthentication"]
+    )
+    assert "flask_resty.jwt" in sys.modules
+
+
+def test_lazy_import_missing(import_flask_resty, monkeypatch):
+    monkeypatch.setitem(sys.modules, "jwt", None)
+
+    flask_resty = import_flask_resty()
+    assert not {
+        "JwtAuthentication",
+        "JwkSetAuthentication",
+        "JwkSetPyJwt",
+    } & {*dir(flask_resty), *flask_resty.__all__}
+
+    with pytest.raises(ImportError):
+        from flask_resty import JwtAuthentication  # noqa: F401
@@ -8,6 +8,44 @@ from flask_resty.testing import assert_response
 # -----------------------------------------------------------------------------
 
 
+class WidgetSchema(Schema):
+    id = fields.Integer(as_string=True)
+
+
+class WidgetViewBase(GenericModelView):
+    schema = WidgetSchema()
+
+
+class WidgetListView(WidgetViewBase):
+    def get(self):
+        return self.list()
+
+    def post(self):
+        return self.create(allow_client_id=True)
+
+
+class WidgetView(WidgetViewBase):
+    def get(self, id):
+        return self.retrieve(id)
+
+
+class CustomWidgetView(WidgetViewBase):
+    def delete(self, id):
+        return self.destroy(id)
+
+    def update_item_raw(self, widget, data):
+        return self.model(id=9)
+
+    def delete_item_raw(self, widget):
+        return self.model(id=9)
+
+    def make_deleted_response(self, widget):
+        return self.make_item_response(widget)
+
+
+# -----------------------------------------------------------------------------
+
+
 @pytest.fixture
 def models(app, db):
     class Widget(db.Model):
@@ -25,42 +63,9 @@ def models(app, db):
 
 
 @pytest.fixture
-def schemas():
-    class WidgetSchema(Schema):
-        id = fields.Integer(as_string=True)
-
-    return {"widget": WidgetSchema()}
-
-
-@pytest.fixture
-def views(models, schemas):
-    class WidgetViewBase(GenericModelView):
-        model = models["widget"]
-        schema = schemas["widget"]
-
-    class WidgetListView(WidgetViewBase):
-        def get(self):
-            return self.list()
-
-        def post(self):
-            return self.create(allow_client_id=True)
-
-    class WidgetView(WidgetViewBase):
-        def get(self, id):
-            return self.retrieve(id)
-
-    class CustomWidgetView(WidgetViewBase):
-        def delete(self, id):
-            return self.destroy(id)
-
-        def update_item_raw(self, widget, data):
-            return self.model(id=9)
-
-        def delete_item_raw(self, widget):
-            return self.model(id=9)
-
-        def make_deleted_response(self, widget):
-            return self.make_item_response(widget)
+def views(models, monkeypatch):
+    # Each test has its own app and database, and so its own model.
+    monkeypatch.setattr(WidgetViewBase, "model", models["widget"])
 
     return {
         "widget_list": WidgetListView,
@@ -121,8 +126,10 @@ def test_create_client_id(app, views, client):
     assert_response(response, 201, {"id": "100"})
 
 
-def test_create_no_location(app, views, client):
-    views["widget_list"].get_location = lambda self, item: None
+def test_create_no_location(app, views, client, monkeypatch):
+    monkeypatch.setattr(
+        views["widget_list"], "get_location", lambda self, item: None
+    )
 
     api = Api(app)
     api.add_resource("/widgets", views["widget_list"], views["widget"])
@@ -1,8 +1,17 @@
 import operator
+from types import SimpleNamespace
 
 import pytest
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Boolean, Column, Integer, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    insert,
+)
 
 from flask_resty import (
     Api,
@@ -19,14 +28,92 @@ from flask_resty.exceptions import ApiError
 from flask_resty.pagination import CursorInfo
 from flask_resty.testing import assert_response, get_body, get_meta
 
+from ._app import app_fixtures
+
+# -----------------------------------------------------------------------------
+
+
+class WidgetSchema(Schema):
+    id = fields.Integer(as_string=True)
+    size = fields.Integer()
+    name = fields.String()
+    is_cool = fields.Boolean()
+
+
+class WidgetValidateSchema(WidgetSchema):
+    size = fields.Integer(validate=validate.Range(max=1))
+
+
+class WidgetListViewBase(GenericModelView):
+    schema = WidgetSchema()
+
+    def get(self):
+        return self.list()
+
+    def post(self):
+        return self.create()
+
+
+class MaxLimitWidgetListView(WidgetListViewBase):
+    pagination = MaxLimitPagination(2)
+
+
+class OptionalLimitWidgetListView(WidgetListViewBase):
+    filtering = Filtering(size=operator.eq)
+    pagination = LimitPagination()
+
+
+class LimitOffsetWidgetListView(WidgetListViewBase):
+    filtering = Filtering(size=operator.eq)
+    pagination = LimitOffsetPagination(2, 4)
+
+
+class PageWidgetListView(WidgetListViewBase):
+    pagination = PagePagination(2)
+
+
+class RelayCursorListView(WidgetListViewBase):
+    sorting = Sorting("id", "size", "is_cool", "name")
+    pagination = RelayCursorPagination(2, page_info_arg="page_info")
+
+
+class RelayCursorNoValidateListView(RelayCursorListView):
+    schema = WidgetValidateSchema()
+
+    pagination = RelayCursorPagination(
+        2, page_info_arg="page_info", validate_values=False
+    )
+
+
+class SizedWidgetListView(WidgetListViewBase):
+    sorting = Sorting("id", "size")
+    pagination = RelayCursorPagination(2, page_info_arg="page_info")
+
+
+class SizedWidgetRowValuesListView(SizedWidgetListView):
+    pagination = RelayCursorPagination(
+        2, page_info_arg="page_info", row_values=True
+    )
+
+
 # -----------------------------------------------------------------------------
 
 
+CURSOR_PAGINATION = RelayCursorPagination(2)
+
+
 def encode_cursor(cursor):
-    return RelayCursorPagination(2).encode_cursor(cursor)
+    return CURSOR_PAGINATION.encode_cursor(cursor)
+
+
+# Cursors for widgets 1 to 15 sorted by size, where each widget's size is the
+# same as its id.
+SIZE_CURSORS = tuple(encode_cursor((i, str(i))) for i in range(1, 16))
+
+app, db, client, clean_db = app_fixtures("module")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def models(app, db):
     class Widget(db.Model):
         __tablename__ = "widgets"
@@ -36,127 +123,108 @@ def models(app, db):
         is_cool = Column(Boolean)
         name = Column(Text)
 
+    # Row value comparisons only apply to non-nullable columns.
+    class SizedWidget(db.Model):
+        __tablename__ = "sized_widgets"
+
+        id = Column(Integer, primary_key=True)
+        size = Column(Integer, nullable=False)
+
     with app.app_context():
         db.create_all()
 
-    yield {"widget": Widget}
+    yield {"widget": Widget, "sized_widget": SizedWidget}
 
     with app.app_context():
         db.drop_all()
 
 
-@pytest.fixture
-def schemas():
-    class WidgetSchema(Schema):
-        id = fields.Integer(as_string=True)
-        size = fields.Integer()
-        name = fields.String()
-        is_cool = fields.Boolean()
-
-    class WidgetValidateSchema(WidgetSchema):
-        size = fields.Integer(validate=validate.Range(max=1))
-
-    return {
-        "widget": WidgetSchema(),
-        "widget_validate": WidgetValidateSchema(),
-    }
-
-
-@pytest.fixture(autouse=True)
-def routes(app, models, schemas):
-    class WidgetListViewBase(GenericModelView):
-        model = models["widget"]
-        schema = schemas["widget"]
-
-        def get(self):
-            return self.list()
-
-        def post(self):
-            return self.create()
-
-    class MaxLimitWidgetListView(WidgetListViewBase):
-        pagination = MaxLimitPagination(2)
-
-    class OptionalLimitWidgetListView(WidgetListViewBase):
-        filtering = Filtering(size=operator.eq)
-        pagination = LimitPagination()
-
-    class LimitOffsetWidgetListView(WidgetListViewBase):
-        filtering = Filtering(size=operator.eq)
-        pagination = LimitOffsetPagination(2, 4)
-
-    class PageWidgetListView(WidgetListViewBase):
-        pagination = PagePagination(2)
-
-    class RelayCursorListView(WidgetListViewBase):
-        sorting = Sorting("id", "size", "is_cool", "name")
-        pagination = RelayCursorPagination(
-            2,
-            page_info_arg="page_info",
+@pytest.fixture(scope="module", autouse=True)
+def routes(app, models):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(WidgetListViewBase, "model", models["widget"])
+        monkeypatch.setattr(
+            SizedWidgetListView, "model", models["sized_widget"]
         )
 
-    class RelayCursorNoValidateListView(RelayCursorListView):
-        schema = schemas["widget_validate"]
-
-        pagination = RelayCursorPagination(
-            2, page_info_arg="page_info", validate_values=False
+        api = Api(app)
+        api.add_resource("/max_limit_widgets", MaxLimitWidgetListView)
+        api.add_resource(
+            "/optional_limit_widgets", OptionalLimitWidgetListView
+        )
+        api.add_resource("/limit_offset_widgets", LimitOffsetWidgetListView)
+        api.add_resource("/page_widgets", PageWidgetListView)
+        api.add_resource("/relay_cursor_widgets", RelayCursorListView)
+        api.add_resource("/sized_widgets", SizedWidgetListView)
+        api.add_resource(
+            "/sized_widgets_row_values", SizedWidgetRowValuesListView
+        )
+        api.add_resource(
+            "/relay_cursor_no_validate_widgets", RelayCursorNoValidateListView
         )
 
-    api = Api(app)
-    api.add_resource("/max_limit_widgets", MaxLimitWidgetListView)
-    api.add_resource("/optional_limit_widgets", OptionalLimitWidgetListView)
-    api.add_resource("/limit_offset_widgets", LimitOffsetWidgetListView)
-    api.add_resource("/page_widgets", PageWidgetListView)
-    api.add_resource("/relay_cursor_widgets", RelayCursorListView)
-    api.add_resource(
-        "/relay_cursor_no_validate_widgets", RelayCursorNoValidateListView
-    )
+        yield
 
 
 @pytest.fixture()
-def add_widgets(app, db, models):
+def add_widgets(app, db, models, clean_db):
     def impl(widgets):
         with app.app_context():
-            db.session.add_all([models["widget"](**data) for data in widgets])
+            db.session.execute(insert(models["widget"]), list(widgets))
             db.session.commit()
 
     return impl
 
 
 @pytest.fixture()
-def data(app, db, models):
+def data(app, db, models, clean_db):
+    with app.app_context():
+        db.session.execute(
+            insert(models["widget"]),
+            [
+                {"id": 1, "size": 1, "is_cool": True, "name": "Whatzit"},
+                {"id": 2, "size": 2, "is_cool": False, "name": "AAA Time"},
+                {"id": 3, "size": 3, "is_cool": True, "name": "Plus Ultra"},
+                {"id": 4, "size": 1, "is_cool": False, "name": "Zendaz"},
+                {"id": 5, "size": 2, "is_cool": False, "name": "Fooz"},
+                {"id": 6, "size": 3, "is_cool": True, "name": "Doodad"},
+            ],
+        )
+        db.session.commit()
+
+
+@pytest.fixture()
+def sized_data(app, db, models, clean_db):
     with app.app_context():
-        db.session.add_all(
-            (
-                models["widget"](id=1, size=1, is_cool=True, name="Whatzit"),
-                models["widget"](id=2, size=2, is_cool=False, name="AAA Time"),
-                models["widget"](
-                    id=3, size=3, is_cool=True, name="Plus Ultra"
-                ),
-                models["widget"](id=4, size=1, is_cool=False, name="Zendaz"),
-                models["widget"](id=5, size=2, is_cool=False, name="Fooz"),
-                models["widget"](id=6, size=3, is_cool=True, name="Doodad"),
-            )
+        db.session.execute(
+            insert(models["sized_widget"]),
+            [
+                {"id": 1, "size": 1},
+                {"id": 2, "size": 2},
+                {"id": 3, "size": 3},
+                {"id": 4, "size": 1},
+                {"id": 5, "size": 2},
+                {"id": 6, "size": 3},
+            ],
         )
         db.session.commit()
 
 
 @pytest.fixture()
-def data_with_nulls(app, db, models):
+def data_with_nulls(app, db, models, clean_db):
     with app.app_context():
-        db.session.add_all(
-            (
-                models["widget"](id=1, size=1, is_cool=True, name="Whatzit"),
-                models["widget"](id=2, size=2, is_cool=False, name="AAA Time"),
-                models["widget"](
-                    id=3, size=3, is_cool=True, name="Plus Ultra"
-                ),
-                models["widget"](id=4, size=1, is_cool=False, name=None),
-                models["widget"](id=5, size=2, is_cool=False, name="Fooz"),
-                models["widget"](id=6, size=3, is_cool=True, name="Doodad"),
-                models["widget"](id=7, size=3, is_cool=True, name=None),
-                models["widget"](id=8, size=3, is_cool=True, name=None),
-            )
+        db.session.execute(
+            insert(models["widget"]),
+            [
+                {"id": 1, "size": 1, "is_cool": True, "name": "Whatzit"},
+                {"id": 2, "size": 2, "is_cool": False, "name": "AAA Time"},
+                {"id": 3, "size": 3, "is_cool": True, "name": "Plus Ultra"},
+                {"id": 4, "size": 1, "is_cool": False, "name": None},
+                {"id": 5, "size": 2, "is_cool": False, "name": "Fooz"},
+                {"id": 6, "size": 3, "is_cool": True, "name": "Doodad"},
+                {"id": 7, "size": 3, "is_cool": True, "name": None},
+                {"id": 8, "size": 3, "is_cool": True, "name": None},
+            ],
         )
         db.session.commit()
 
@@ -197,98 +265,83 @@ def test_unset_limit(client, data):
     assert get_meta(response) == {"has_next_page": False}
 
 
-def test_limit_offset(client, data):
-    response = client.get("/limit_offset_widgets?offset=2&limit=3")
-
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "3", "size": 3},
-            {"id": "4", "size": 1},
-            {"id": "5", "size": 2},
-        ],
-    )
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_default(client, data):
-    response = client.get("/limit_offset_widgets")
-
-    assert_response(
-        response, 200, [{"id": "1", "size": 1}, {"id": "2", "size": 2}]
-    )
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_limit(client, data):
-    response = client.get("/limit_offset_widgets?limit=3")
-
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "1", "size": 1},
-            {"id": "2", "size": 2},
-            {"id": "3", "size": 3},
-        ],
-    )
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_max_limit(client, data):
-    response = client.get("/limit_offset_widgets?limit=5")
-
-    assert_response(
-        response,
-        200,
-        [
-            {"id": "1", "size": 1},
-            {"id": "2", "size": 2},
-            {"id": "3", "size": 3},
-            {"id": "4", "size": 1},
-        ],
-    )
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_offset(client, data):
-    response = client.get("/limit_offset_widgets?offset=2")
-
-    assert_response(
-        response, 200, [{"id": "3", "size": 3}, {"id": "4", "size": 1}]
-    )
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_offset_end(client, data):
-    response = client.get("/limit_offset_widgets?offset=4")
-
-    assert_response(
-        response, 200, [{"id": "5", "size": 2}, {"id": "6", "size": 3}]
-    )
-    assert get_meta(response) == {"has_next_page": False}
-
-
-def test_limit_offset_offset_truncate(client, data):
-    response = client.get("/limit_offset_widgets?offset=5")
-
-    assert_response(response, 200, [{"id": "6", "size": 3}])
-    assert get_meta(response) == {"has_next_page": False}
-
-
-def test_limit_offset_filtered(client, data):
-    response = client.get("/limit_offset_widgets?size=2&limit=1")
-
-    assert_response(response, 200, [{"id": "2", "size": 2}])
-    assert get_meta(response) == {"has_next_page": True}
-
-
-def test_limit_offset_filtered_offset(client, data):
-    response = client.get("/limit_offset_widgets?size=2&offset=1")
+@pytest.mark.parametrize(
+    ("url", "expected", "has_next_page"),
+    (
+        pytest.param(
+            "/limit_offset_widgets?offset=2&limit=3",
+            [
+                {"id": "3", "size": 3},
+                {"id": "4", "size": 1},
+                {"id": "5", "size": 2},
+            ],
+            True,
+            id="offset_limit",
+        ),
+        pytest.param(
+            "/limit_offset_widgets",
+            [{"id": "1", "size": 1}, {"id": "2", "size": 2}],
+            True,
+            id="default",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?limit=3",
+            [
+                {"id": "1", "size": 1},
+                {"id": "2", "size": 2},
+                {"id": "3", "size": 3},
+            ],
+            True,
+            id="limit",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?limit=5",
+            [
+                {"id": "1", "size": 1},
+                {"id": "2", "size": 2},
+                {"id": "3", "size": 3},
+                {"id": "4", "size": 1},
+            ],
+            True,
+            id="max_limit",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?offset=2",
+            [{"id": "3", "size": 3}, {"id": "4", "size": 1}],
+            True,
+            id="offset",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?offset=4",
+            [{"id": "5", "size": 2}, {"id": "6", "size": 3}],
+            False,
+            id="offset_end",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?offset=5",
+            [{"id": "6", "size": 3}],
+            False,
+            id="offset_truncate",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?size=2&limit=1",
+            [{"id": "2", "size": 2}],
+            True,
+            id="filtered",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?size=2&offset=1",
+            [{"id": "5", "size": 2}],
+            False,
+            id="filtered_offset",
+        ),
+    ),
+)
+def test_limit_offset(client, data, url, expected, has_next_page):
+    response = client.get(url)
 
-    assert_response(response, 200, [{"id": "5", "size": 2}])
-    assert get_meta(response) == {"has_next_page": False}
+    assert_response(response, 200, expected)
+    assert get_meta(response) == {"has_next_page": has_next_page}
 
 
 def test_limit_offset_create(client, data):
@@ -633,29 +686,29 @@ def test_relay_page_info_forwards(client, add_widgets):
 
     assert get_meta(resp) == {
         "has_next_page": True,
-        "cursors": [encode_cursor((i, str(i))) for i in range(1, 6)],
+        "cursors": list(SIZE_CURSORS[0:5]),
         "index": 0,
         "total": 15,
     }
 
     resp = client.get(
-        f"/relay_cursor_widgets?sort=size&first=5&after={encode_cursor((5, '5'))}&page_info=true"
+        f"/relay_cursor_widgets?sort=size&first=5&after={SIZE_CURSORS[4]}&page_info=true"
     )
 
     assert get_meta(resp) == {
         "has_next_page": True,
-        "cursors": [encode_cursor((i, str(i))) for i in range(6, 11)],
+        "cursors": list(SIZE_CURSORS[5:10]),
         "index": 5,
         "total": 15,
     }
 
     resp = client.get(
-        f"/relay_cursor_widgets?sort=size&first=5&after={encode_cursor((10, '10'))}&page_info=true"
+        f"/relay_cursor_widgets?sort=size&first=5&after={SIZE_CURSORS[9]}&page_info=true"
     )
 
     assert get_meta(resp) == {
         "has_next_page": False,
-        "cursors": [encode_cursor((i, str(i))) for i in range(11, 16)],
+        "cursors": list(SIZE_CURSORS[10:15]),
         "index": 10,
         "total": 15,
     }
@@ -668,29 +721,29 @@ def test_relay_page_info_backwards(client, add_widgets):
 
     assert get_meta(resp) == {
         "has_next_page": True,
-        "cursors": [encode_cursor((i, str(i))) for i in range(11, 16)],
+        "cursors": list(SIZE_CURSORS[10:15]),
         "index": 10,
         "total": 15,
     }
 
     resp = client.get(
-        f"/relay_cursor_widgets?sort=size&last=5&before={encode_cursor((11, '11'))}&page_info=true"
+        f"/relay_cursor_widgets?sort=size&last=5&before={SIZE_CURSORS[10]}&page_info=true"
     )
 
     assert get_meta(resp) == {
         "has_next_page": True,
-        "cursors": [encode_cursor((i, str(i))) for i in range(6, 11)],
+        "cursors": list(SIZE_CURSORS[5:10]),
         "index": 5,
         "total": 15,
     }
 
     resp = client.get(
-        f"/relay_cursor_widgets?sort=size&last=5&before={encode_cursor((6, '6'))}&page_info=true"
+        f"/relay_cursor_widgets?sort=size&last=5&before={SIZE_CURSORS[5]}&page_info=true"
     )
 
     assert get_meta(resp) == {
         "has_next_page": False,
-        "cursors": [encode_cursor((i, str(i))) for i in range(1, 6)],
+        "cursors": list(SIZE_CURSORS[0:5]),
         "index": 0,
         "total": 15,
     }
@@ -701,12 +754,12 @@ def test_relay_page_info_backwards(client, add_widgets):
     # --------- ^
     # 2: 3."3"
     resp = client.get(
-        f"/relay_cursor_widgets?sort=size&last=5&before={encode_cursor((3, '3'))}&page_info=true"
+        f"/relay_cursor_widgets?sort=size&last=5&before={SIZE_CURSORS[2]}&page_info=true"
     )
 
     assert get_meta(resp) == {
         "has_next_page": False,
-        "cursors": [encode_cursor((i, str(i))) for i in range(1, 3)],
+        "cursors": list(SIZE_CURSORS[0:2]),
         "index": 0,
         "total": 15,
     }
@@ -715,96 +768,75 @@ def test_relay_page_info_backwards(client, add_widgets):
 # -----------------------------------------------------------------------------
 
 
-def test_error_invalid_limit_type(client, data):
-    response = client.get("/limit_offset_widgets?limit=foo")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_limit", "source": {"parameter": "limit"}}],
-    )
-
-
-def test_error_invalid_limit_value(client, data):
-    response = client.get("/limit_offset_widgets?limit=-1")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_limit", "source": {"parameter": "limit"}}],
-    )
-
-
-def test_error_invalid_offset_type(client, data):
-    response = client.get("/limit_offset_widgets?offset=foo")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_offset", "source": {"parameter": "offset"}}],
-    )
-
-
-def test_error_invalid_offset_value(client, data):
-    response = client.get("/limit_offset_widgets?offset=-1")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_offset", "source": {"parameter": "offset"}}],
-    )
-
-
-def test_error_invalid_page_type(client, data):
-    response = client.get("/page_widgets?page=foo")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_page", "source": {"parameter": "page"}}],
-    )
-
-
-def test_error_invalid_page_value(client, data):
-    response = client.get("/page_widgets?page=-1")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_page", "source": {"parameter": "page"}}],
-    )
-
-
-def test_error_invalid_relay_cursor_encoding(client, data):
-    response = client.get("/relay_cursor_widgets?cursor=_")
-    assert_response(
-        response,
-        400,
-        [
-            {
-                "code": "invalid_cursor.encoding",
-                "source": {"parameter": "cursor"},
-            }
-        ],
-    )
-
-
-def test_error_invalid_relay_cursor_length(client, data):
-    response = client.get("/relay_cursor_widgets?cursor=MQ.MQ")
-    assert_response(
-        response,
-        400,
-        [{"code": "invalid_cursor.length", "source": {"parameter": "cursor"}}],
-    )
-
-
-def test_error_invalid_relay_cursor_field(client, data):
-    response = client.get("/relay_cursor_widgets?cursor=Zm9v")
-    assert_response(
-        response,
-        400,
-        [
-            {
-                "code": "invalid_cursor",
-                "detail": "Not a valid integer.",
-                "source": {"parameter": "cursor"},
-            }
-        ],
-    )
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    (
+        pytest.param(
+            "/limit_offset_widgets?limit=foo",
+            [{"code": "invalid_limit", "source": {"parameter": "limit"}}],
+            id="limit_type",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?limit=-1",
+            [{"code": "invalid_limit", "source": {"parameter": "limit"}}],
+            id="limit_value",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?offset=foo",
+            [{"code": "invalid_offset", "source": {"parameter": "offset"}}],
+            id="offset_type",
+        ),
+        pytest.param(
+            "/limit_offset_widgets?offset=-1",
+            [{"code": "invalid_offset", "source": {"parameter": "offset"}}],
+            id="offset_value",
+        ),
+        pytest.param(
+            "/page_widgets?page=foo",
+            [{"code": "invalid_page", "source": {"parameter": "page"}}],
+            id="page_type",
+        ),
+        pytest.param(
+            "/page_widgets?page=-1",
+            [{"code": "invalid_page", "source": {"parameter": "page"}}],
+            id="page_value",
+        ),
+        pytest.param(
+            "/relay_cursor_widgets?cursor=_",
+            [
+                {
+                    "code": "invalid_cursor.encoding",
+                    "source": {"parameter": "cursor"},
+                }
+            ],
+            id="relay_cursor_encoding",
+        ),
+        pytest.param(
+            "/relay_cursor_widgets?cursor=MQ.MQ",
+            [
+                {
+                    "code": "invalid_cursor.length",
+                    "source": {"parameter": "cursor"},
+                }
+            ],
+            id="relay_cursor_length",
+        ),
+        pytest.param(
+            "/relay_cursor_widgets?cursor=Zm9v",
+            [
+                {
+                    "code": "invalid_cursor",
+                    "detail": "Not a valid integer.",
+                    "source": {"parameter": "cursor"},
+                }
+            ],
+            id="relay_cursor_field",
+        ),
+    ),
+)
+def test_error_invalid(client, data, url, expected):
+    response = client.get(url)
+    assert_response(response, 400, expected)
 
 
 @pytest.mark.parametrize(
@@ -904,20 +936,11 @@ def test_pagination_limit_parsing(app, param):
     "param",
     ("cursor", "after", "before"),
 )
-def test_pagination_cursor_parsing(app, param, models, schemas):
-    class View(GenericModelView):
-        model = models["widget"]
-        schema = schemas["widget"]
-
+def test_pagination_cursor_parsing(app, param):
+    class View(WidgetListViewBase):
         sorting = Sorting("id", "size", "is_cool")
         pagination = RelayCursorPagination()
 
-        def get(self):
-            return self.list()
-
-        def post(self):
-            return self.create()
-
     with app.test_request_context() as req:
         req.request.args = {param: "not-a-valid-cursor"}
         view = View()
@@ -925,3 +948,72 @@ def test_pagination_cursor_parsing(app, param, models, schemas):
             view.pagination.get_page(view.query, view)
 
         assert e.value.body["errors"][0]["source"]["parameter"] == param
+
+
+@pytest.mark.parametrize(
+    "query",
+    (
+        "sort=size&cursor=MQ.MQ",
+        "sort=size,id&cursor=MQ.MQ",
+        "sort=-size&cursor=Mg.NQ&page_info=true",
+        f"sort=size&first=3&after={encode_cursor((1, 4))}",
+        f"sort=-size&first=3&after={encode_cursor((3, 3))}",
+        f"sort=size&last=3&before={encode_cursor((3, 3))}&page_info=true",
+        f"sort=-size&last=3&before={encode_cursor((1, 1))}",
+        f"sort=size&before={encode_cursor((2, 5))}",
+    ),
+)
+def test_relay_cursor_row_values_equivalent(client, sized_data, query):
+    response = client.get(f"/sized_widgets_row_values?{query}")
+    expected_response = client.get(f"/sized_widgets?{query}")
+
+    assert_response(response, 200, get_body(expected_response)["data"])
+    assert get_meta(response) == get_meta(expected_response)
+
+
+@pytest.mark.parametrize(
+    ("field_orderings", "cursor", "expected"),
+    (
+        pytest.param(
+            (("size", True), ("id", True)),
+            (2, 5),
+            "(gadgets.size, gadgets.id) > (:param_1, :param_2)",
+            id="asc",
+        ),
+        pytest.param(
+            (("size", False), ("id", False)),
+            (2, 5),
+            "(gadgets.size, gadgets.id) < (:param_1, :param_2)",
+            id="desc",
+        ),
+        pytest.param(
+            (("size", True), ("id", False)), (2, 5), None, id="mixed"
+        ),
+        pytest.param(
+            (("weight", True), ("id", True)), (2, 5), None, id="nullable"
+        ),
+        pytest.param((("id", True),), (5,), None, id="single"),
+    ),
+)
+def test_relay_cursor_row_values(field_orderings, cursor, expected):
+    table = Table(
+        "gadgets",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("size", Integer, nullable=False),
+        Column("weight", Integer),
+    )
+    view = SimpleNamespace(
+        model=table.c, sorting=Sorting("id", "size", "weight")
+    )
+
+    clause = RelayCursorPagination(row_values=True).get_filter(
+        view, field_orderings, cursor
+    )
+
+    if expected is None:
+        # Fall back to the same filter as without row values.
+        expected = str(
+            RelayCursorPagination().get_filter(view, field_orderings, cursor)
+        )
+    assert str(clause) == expected
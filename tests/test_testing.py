@@ -1,3 +1,5 @@
+import json
+
 import flask
 import pytest
 
@@ -10,6 +12,7 @@ from flask_resty.testing import (
     assert_response,
     assert_shape,
     get_body,
+    get_data,
 )
 
 # -----------------------------------------------------------------------------
@@ -181,3 +184,14 @@ def test_assert_response_returns_custom_errors(app):
 
     response_errors = assert_response(response, 400, get_errors=get_body)
     assert response_errors == errors
+
+
+def test_get_body_fresh(app):
+    with app.test_request_context():
+        response = flask.jsonify({"data": {"foo": "bar"}, "meta": {}})
+
+    get_data(response)["foo"] = "baz"
+    assert get_body(response) == {"data": {"foo": "bar"}, "meta": {}}
+
+    response.set_data(json.dumps({"data": {"foo": "baz"}}))
+    assert get_body(response) == {"data": {"foo": "baz"}}